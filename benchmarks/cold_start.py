@@ -0,0 +1,164 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# Cold-start benchmark for the dashboard pages.
+#
+# Every page is run headlessly with Streamlit's AppTest in a fresh interpreter
+# started with `python -X importtime`, so each measurement pays the same import
+# and first-render cost as a newly autoscaled replica. Streamlit itself is
+# imported before the clock starts; only what the page adds is counted.
+#
+# Budgets are relative to the cost of a bare `import streamlit` measured in the
+# same process, so they carry over between machines. They were calibrated on a
+# Python 3.11 devcontainer (mcr.microsoft.com/devcontainers/python:1-3.11-bullseye)
+# where `import streamlit` takes 300-400ms. COLD_START_HEADROOM scales every
+# budget (default 1.5, i.e. 50% headroom over the calibrated ratios).
+#
+# Pages always run with an empty st.secrets, even where .streamlit/secrets.toml
+# holds real credentials, so every measurement covers the same credential-free
+# first paint: static content, the sidebar skeleton and the connection-error
+# path. Database connect and query latency is never part of the budget, and the
+# DB pages must not import SQLAlchemy or the MySQL driver before credentials exist.
+#
+# Run it from the repository root:
+#   python benchmarks/cold_start.py              # report and enforce the budgets
+#   python benchmarks/cold_start.py --runs 5     # take the median of 5 cold runs
+#   COLD_START_HEADROOM=2 python benchmarks/cold_start.py
+# The test suite (tests/test_cold_start.py) enforces the same budgets on a single
+# run per page with twice the headroom.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not be imported until a page actually needs them
+LAZY_MODULES = ("gurobipy", "altair", "sqlalchemy", "pymysql")
+
+# Per-page budgets as multiples of the `import streamlit` time: (page imports, headless script run)
+BUDGETS = {
+    "Home.py": (0.1, 0.5),
+    "pages/Active Members.py": (1.0, 1.5),
+    "pages/Equipment Allocation.py": (1.0, 1.5),
+    "pages/Top Nutritionists.py": (1.0, 1.5),
+}
+
+HEADROOM = float(os.environ.get("COLD_START_HEADROOM", "1.5"))
+
+MARKER = "cold_start: page run begins"
+
+RUNNER = """
+import json, sys, time
+import streamlit
+from streamlit.runtime.secrets import Secrets
+from streamlit.testing.v1 import AppTest
+
+# Empty secrets instead of falling back to .streamlit/secrets.toml
+streamlit.secrets = Secrets()
+streamlit.secrets._secrets = {{}}
+
+page = sys.argv[1]
+sys.stderr.write({marker!r} + "\\n")
+sys.stderr.flush()
+start = time.perf_counter()
+at = AppTest.from_file(page, default_timeout=60).run()
+elapsed = time.perf_counter() - start
+lazy = sorted(m for m in {lazy!r} if m in sys.modules)
+stopped_on_error = bool(at.exception) or bool(at.error)
+print(json.dumps({{"run_ms": elapsed * 1000, "lazy_imported": lazy, "stopped_on_error": stopped_on_error}}))
+""".format(marker=MARKER, lazy=LAZY_MODULES)
+
+
+def parse_importtime(stderr):
+    # Cumulative time of `import streamlit`, and of the top-level imports made after the page started running
+    streamlit_us = 0
+    page_us = 0
+    seen_marker = False
+    for line in stderr.splitlines():
+        if line.strip() == MARKER:
+            seen_marker = True
+            continue
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line.split("|")
+        # Nested imports are indented beyond the single separator space
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue
+        if seen_marker:
+            page_us += int(cumulative)
+        elif name.strip() == "streamlit":
+            streamlit_us = int(cumulative)
+    return streamlit_us / 1000, page_us / 1000
+
+
+def measure_page(page):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", RUNNER, os.path.join(ROOT, page)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{page} failed to run:\n{proc.stderr[-2000:]}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["streamlit_ms"], result["import_ms"] = parse_importtime(proc.stderr)
+    return result
+
+
+def budgets_ms(page, reference_ms, headroom=HEADROOM):
+    # (page import budget, headless run budget) in milliseconds
+    import_ratio, run_ratio = BUDGETS[page]
+    return import_ratio * reference_ms * headroom, run_ratio * reference_ms * headroom
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure and enforce page cold-start budgets.")
+    parser.add_argument("--runs", type=int, default=3, help="cold runs per page (median is reported)")
+    parser.add_argument("--no-enforce", action="store_true", help="report only, never fail")
+    args = parser.parse_args()
+
+    measurements = {page: [measure_page(page) for _ in range(args.runs)] for page in BUDGETS}
+    reference_ms = median([r["streamlit_ms"] for runs in measurements.values() for r in runs])
+    print(f"Reference: import streamlit = {reference_ms:.1f}ms, headroom x{HEADROOM:g}\n")
+
+    failures = []
+    notes = []
+    print(f"{'Page':<32} {'Import (ms)':>12} {'Budget':>8} {'Run (ms)':>10} {'Budget':>8}  Lazy modules loaded")
+    for page, runs in measurements.items():
+        import_ms = median([r["import_ms"] for r in runs])
+        run_ms = median([r["run_ms"] for r in runs])
+        import_budget, run_budget = budgets_ms(page, reference_ms)
+        lazy = sorted({m for r in runs for m in r["lazy_imported"]})
+        print(f"{page:<32} {import_ms:>12.1f} {import_budget:>8.0f} {run_ms:>10.1f} {run_budget:>8.0f}  {', '.join(lazy) or '-'}")
+
+        if any(r["stopped_on_error"] for r in runs):
+            notes.append(f"{page}: the run stopped at an error (no database credentials are provided); "
+                         "Run (ms) covers the static content and the error path only")
+        if import_ms > import_budget:
+            failures.append(f"{page}: page imports took {import_ms:.1f}ms (budget {import_budget:.0f}ms)")
+        if run_ms > run_budget:
+            failures.append(f"{page}: headless run took {run_ms:.1f}ms (budget {run_budget:.0f}ms)")
+        if lazy:
+            failures.append(f"{page}: imported {', '.join(lazy)} on first load")
+
+    if notes:
+        print("\nNotes:")
+        for note in notes:
+            print(f"- {note}")
+
+    if failures:
+        print("\nCold-start budget exceeded:")
+        for failure in failures:
+            print(f"- {failure}")
+        if not args.no_enforce:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
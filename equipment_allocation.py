@@ -0,0 +1,286 @@
+import hashlib
+import itertools
+import multiprocessing
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+# Optional column used to split the usage data into monthly scenarios
+MONTH_COLUMN = "Month"
+
+# ------------------------------
+# Preprocessing
+# ------------------------------
+
+def build_usage_counts(data):
+    # Unique program types and equipment names, in order of first appearance
+    program_types = data['Program_type'].unique().tolist()
+    equipment_names = data['Equipment_Name'].unique().tolist()
+
+    # Nested dictionary of usage counts; later rows win, as in the single-run page
+    usage_counts = {}
+    for program, equipment, count in zip(data['Program_type'], data['Equipment_Name'], data['Usage_Count']):
+        usage_counts.setdefault(program, {})[equipment] = count
+    return program_types, equipment_names, usage_counts
+
+
+def preprocess_usage(data):
+    # Build the usage counts once for the full dataset (key None) and once per month,
+    # so every scenario only has to apply its perturbation on top of them
+    prepared = {None: build_usage_counts(data)}
+    if MONTH_COLUMN in data.columns:
+        # Rows without a month only count towards the full dataset
+        for month, month_data in data.dropna(subset=[MONTH_COLUMN]).groupby(MONTH_COLUMN, sort=False):
+            prepared[month] = build_usage_counts(month_data)
+    return prepared
+
+
+def prepared_months(prepared):
+    # Months available for monthly scenarios, sorted naturally when the values allow it
+    months = [month for month in prepared if month is not None]
+    try:
+        return sorted(months)
+    except TypeError:
+        return sorted(months, key=str)
+
+# ------------------------------
+# Optimization Model
+# ------------------------------
+
+def solve_allocation(program_types, equipment_names, usage_counts, env=None):
+    # gurobipy is only loaded once a model is actually solved
+    import gurobipy as gp
+    from gurobipy import GRB
+
+    start = time.perf_counter()
+    model = gp.Model("Equipment Allocation", env=env) if env is not None else gp.Model("Equipment Allocation")
+    x = model.addVars(program_types, equipment_names, vtype=GRB.BINARY, name="x")
+
+    # Objective: Maximize total usage count
+    model.setObjective(
+        gp.quicksum(x[i, j] * usage_counts.get(i, {}).get(j, 0) for i in program_types for j in equipment_names),
+        GRB.MAXIMIZE
+    )
+
+    # Equipment availability
+    for j in equipment_names:
+        model.addConstr(
+            gp.quicksum(x[i, j] for i in program_types) <= 1,
+            name=f"Equipment_Availability_{j}"
+        )
+
+    model.optimize()
+
+    result = {"optimal": model.status == GRB.OPTIMAL, "objective": None, "allocation": {}}
+    if result["optimal"]:
+        result["objective"] = model.ObjVal
+        for i in program_types:
+            for j in equipment_names:
+                if x[i, j].x > 0.5:
+                    result["allocation"][j] = i
+    model.dispose()
+    result["solve_time"] = time.perf_counter() - start
+    return result
+
+# ------------------------------
+# Scenario Sweep
+# ------------------------------
+
+def build_scenario_grid(months=(None,), removed_equipment=((),), multipliers=({},)):
+    # Cartesian product of the perturbation axes; each axis should include its
+    # "no change" value (None, () or {}) if the unperturbed variant is wanted
+    scenarios = []
+    for month, removed, factors in itertools.product(months, removed_equipment, multipliers):
+        parts = []
+        if month is not None:
+            parts.append(f"{MONTH_COLUMN}={month}")
+        if removed:
+            parts.append("without " + ", ".join(map(str, removed)))
+        for program, factor in factors.items():
+            parts.append(f"{program} x{factor:g}")
+        scenarios.append({
+            "name": "; ".join(parts) or "Baseline",
+            "month": month,
+            "removed_equipment": tuple(removed),
+            "multipliers": dict(factors),
+        })
+    return scenarios
+
+
+def apply_scenario(prepared, scenario):
+    program_types, equipment_names, usage_counts = prepared[scenario["month"]]
+    removed = set(scenario["removed_equipment"])
+    multipliers = scenario["multipliers"]
+
+    equipment_names = [j for j in equipment_names if j not in removed]
+    usage_counts = {
+        i: {j: count * multipliers.get(i, 1) for j, count in counts.items() if j not in removed}
+        for i, counts in usage_counts.items()
+    }
+    return program_types, equipment_names, usage_counts
+
+
+# Grids up to this many solves run in the calling process; each solve takes milliseconds,
+# so shipping them to worker processes costs more than it saves
+IN_PROCESS_SCENARIOS = 50
+
+# Per-process state: the Gurobi environment and the last dataset this worker solved
+_worker_env = None
+_worker_prepared = (None, None)
+
+# Worker pool shared by every sweep in this server process
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _quiet_env():
+    import gurobipy as gp
+
+    # Quiet, single-threaded Gurobi environment; parallelism comes from the pool
+    env = gp.Env(empty=True)
+    env.setParam("OutputFlag", 0)
+    env.setParam("Threads", 1)
+    env.start()
+    return env
+
+
+def _init_worker():
+    global _worker_env
+    _worker_env = _quiet_env()
+
+
+def _solve_chunk(key, path, chunk):
+    global _worker_prepared
+    # Load each dataset from disk once per worker instead of receiving it with every task
+    if _worker_prepared[0] != key:
+        with open(path, "rb") as f:
+            _worker_prepared = (key, pickle.load(f))
+    prepared = _worker_prepared[1]
+    return [solve_allocation(*apply_scenario(prepared, scenario), env=_worker_env) for scenario in chunk]
+
+
+def get_sweep_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = available_cpus()
+            # Spawn rather than fork: the Streamlit server is multithreaded and gurobipy is not fork-safe
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            # Under Streamlit, __main__ is the page script and spawn would re-run it in every
+            # worker. Point it at this module while all workers are started up front.
+            main_module = sys.modules["__main__"]
+            sys.modules["__main__"] = sys.modules[__name__]
+            try:
+                futures = [executor.submit(int) for _ in range(workers)]
+            finally:
+                sys.modules["__main__"] = main_module
+            for future in futures:
+                future.result()
+            _executor = executor
+        return _executor
+
+
+def _reset_sweep_executor(executor):
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False)
+
+
+def _share_prepared(prepared):
+    # Write the preprocessed data to a file named by its content, once per dataset
+    payload = pickle.dumps(prepared)
+    key = hashlib.sha1(payload).hexdigest()
+    path = os.path.join(tempfile.gettempdir(), f"equipment_allocation_{key}.pkl")
+    if not os.path.exists(path):
+        with tempfile.NamedTemporaryFile(delete=False, dir=os.path.dirname(path)) as temp_file:
+            temp_file.write(payload)
+        os.replace(temp_file.name, path)
+    return key, path
+
+
+def available_cpus():
+    # CPUs this process may run on; respects affinity masks set by container runtimes
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def baseline_scenario(month):
+    # The unperturbed scenario every perturbation of the same month is compared with
+    return build_scenario_grid(months=(month,))[0]
+
+
+def compare_to_baseline(scenarios, results, baselines):
+    # baselines maps each month (None for the full dataset) to its unperturbed result
+    rows = []
+    for scenario, result in zip(scenarios, results):
+        baseline = baselines[scenario["month"]]
+        changes = None
+        objective_change = None
+        if result["optimal"] and baseline["optimal"]:
+            changes = sorted(
+                str(j) for j in set(baseline["allocation"]) | set(result["allocation"])
+                if baseline["allocation"].get(j) != result["allocation"].get(j)
+            )
+            objective_change = result["objective"] - baseline["objective"]
+        rows.append({
+            "Scenario": scenario["name"],
+            "Baseline": baseline_scenario(scenario["month"])["name"],
+            "Optimal": result["optimal"],
+            "Objective": result["objective"],
+            "Objective Change": objective_change,
+            "Allocation Changes": len(changes) if changes is not None else None,
+            "Changed Equipment": ", ".join(changes) if changes is not None else None,
+            "Solve Time (s)": round(result["solve_time"], 4),
+        })
+    return pd.DataFrame(rows)
+
+
+def run_scenario_sweep(prepared, scenarios, max_workers=None):
+    max_workers = max_workers or available_cpus()
+
+    # Unperturbed solve per month; reuse grid entries that already are one
+    baseline_index = {}
+    for index, scenario in enumerate(scenarios):
+        if scenario == baseline_scenario(scenario["month"]):
+            baseline_index.setdefault(scenario["month"], index)
+    missing = [month for month in dict.fromkeys(s["month"] for s in scenarios) if month not in baseline_index]
+    tasks = list(scenarios) + [baseline_scenario(month) for month in missing]
+
+    workers = min(max_workers, len(tasks))
+    if workers <= 1 or len(tasks) <= IN_PROCESS_SCENARIOS:
+        env = _quiet_env()
+        try:
+            results = [solve_allocation(*apply_scenario(prepared, scenario), env=env) for scenario in tasks]
+        finally:
+            env.dispose()
+    else:
+        # One contiguous chunk per worker; the solves are roughly the same size
+        key, path = _share_prepared(prepared)
+        executor = get_sweep_executor()
+        bounds = [len(tasks) * k // workers for k in range(workers + 1)]
+        try:
+            futures = [executor.submit(_solve_chunk, key, path, tasks[lo:hi]) for lo, hi in zip(bounds, bounds[1:])]
+            results = [result for future in futures for result in future.result()]
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool on the next sweep
+            _reset_sweep_executor(executor)
+            raise
+
+    baselines = {month: results[len(scenarios) + k] for k, month in enumerate(missing)}
+    baselines.update({month: results[index] for month, index in baseline_index.items()})
+    results = results[:len(scenarios)]
+    return compare_to_baseline(scenarios, results, baselines), baselines
@@ -1,21 +1,35 @@
 import streamlit as st
 import pandas as pd
-from sqlalchemy import create_engine, text
 import tempfile
-import altair as alt  # for richer visualizations
 
 # Load environment variables from .env file (if using)
 
-# ------------------------------
-# Database Connection
-# ------------------------------
+st.set_page_config(page_title="Active Members", layout="wide")
 
-# Create the database engine and test connection
+# Static content and the sidebar skeleton render before the database is touched
+st.title("Active Members' BMI Change and Workout Frequency Analysis")
 
-st.set_page_config(page_title="Active Members", layout="wide")
+st.markdown("""
+**Explanation**:
+This enhanced dashboard uses the `Active_Member_BMI_Workout_View` to focus on:
+- **Average_BMI**: Gives an idea of the member's BMI trend.
+- **BMI_Change**: How much their BMI has changed over recorded measurements.
+- **Workout_Session_Count**: How many sessions they've attended.
+- **BMI_Change_Per_Session**: Efficiency metric indicating how much BMI changes per workout session.
 
+The filters allow for a detailed investigation of specific subgroups of members, and the visualizations offer additional perspectives on the data.
+""")
 
-try:
+# Sidebar Filters
+st.sidebar.header("Filters")
+
+# ------------------------------
+# Database Connection
+# ------------------------------
+
+# Create the database engine once per server process
+@st.cache_resource(show_spinner=False)
+def get_engine():
     # Aiven server credentials
     DB_USER = st.secrets["database"]["DB_USER"]
     DB_PASS = st.secrets["database"]["DB_PASS"]
@@ -29,24 +43,34 @@ try:
         temp_file.write(ssl_ca.encode('utf-8'))  # Write the certificate content
         SSL_CA_PATH = temp_file.name  # Save the temporary file path
 
+    # SQLAlchemy and the MySQL driver are only imported once credentials are available
+    from sqlalchemy import create_engine
+
     # Create the database engine with SSL enabled
     engine = create_engine(
         f"mysql+pymysql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}?ssl_ca={SSL_CA_PATH}"
     )
+    return engine
 
-    # Test the connection
-    with engine.connect() as conn:
-        conn.execute(text("SELECT 1"))
+
+try:
+    with st.spinner("Connecting to the Aiven database..."):
+        engine = get_engine()
+        from sqlalchemy import text
+
+        # Test the connection on every run; the cached engine outlives outages
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
     st.success("Connected to the Aiven database successfully!")
 except Exception as e:
     st.error(f"Error connecting to the Aiven database: {e}")
     st.stop()
 
 
-st.title("Active Members' BMI Change and Workout Frequency Analysis")
-
 @st.cache_data
 def load_bmi_workout_data():
+    from sqlalchemy import text
+
     # Query from the created view
     query = "SELECT * FROM Active_Member_BMI_Workout_View;"
     with engine.connect() as conn:
@@ -59,10 +83,12 @@ def load_bmi_workout_data():
             df[col] = pd.to_numeric(df[col], errors='coerce')
     return df
 
-df = load_bmi_workout_data()
-
-# Sidebar Filters
-st.sidebar.header("Filters")
+try:
+    with st.spinner("Loading member data..."):
+        df = load_bmi_workout_data()
+except Exception as e:
+    st.error(f"Error loading member data: {e}")
+    st.stop()
 
 # Average BMI Filter
 st.sidebar.subheader("Filter by Average BMI")
@@ -98,17 +124,6 @@ reset_filters = st.sidebar.button("Reset Filters")
 if reset_filters:
     st.rerun()
 
-st.markdown("""
-**Explanation**:
-This enhanced dashboard uses the `Active_Member_BMI_Workout_View` to focus on:
-- **Average_BMI**: Gives an idea of the member's BMI trend.
-- **BMI_Change**: How much their BMI has changed over recorded measurements.
-- **Workout_Session_Count**: How many sessions they've attended.
-- **BMI_Change_Per_Session**: Efficiency metric indicating how much BMI changes per workout session.
-
-The filters allow for a detailed investigation of specific subgroups of members, and the visualizations offer additional perspectives on the data.
-""")
-
 if apply_filters:
     # Apply filters to the df
     filtered_df = df[
@@ -126,6 +141,8 @@ if apply_filters:
     if not filtered_df.empty:
         st.dataframe(filtered_df)
 
+        import altair as alt  # for richer visualizations
+
         # Bar chart: BMI_Change_Per_Session by Member_ID
         st.subheader("BMI Change Per Session (Bar Chart)")
         bar_chart = alt.Chart(filtered_df).mark_bar().encode(
@@ -1,7 +1,16 @@
 import streamlit as st
 import pandas as pd
-import gurobipy as gp
-from gurobipy import GRB
+import time
+from equipment_allocation import (
+    MONTH_COLUMN,
+    available_cpus,
+    build_scenario_grid,
+    build_usage_counts,
+    prepared_months,
+    preprocess_usage,
+    run_scenario_sweep,
+    solve_allocation,
+)
 
 # Set up the page title
 st.title("Optimization: Equipment Allocation")
@@ -14,11 +23,21 @@ This page demonstrates an optimization model designed to allocate available equi
 - Program types must share equipment optimally to maximize overall usage.
 
 **Goal**: Ensure optimal utilization of equipment across program types.
+
+### Scenario Sweep
+Switch to **Scenario Sweep** to compare allocations across many what-if scenarios built from the uploaded data:
+- **Months**: Solve each month separately (requires a `Month` column).
+- **Equipment removal**: Drop a piece of equipment and see how the remaining equipment is reallocated.
+- **Usage multipliers**: Scale the usage counts of a program type up or down.
+
+Every combination is compared against the unperturbed allocation for the same month. Large grids are solved in parallel worker processes that stay warm between sweeps.
 """)
 
 # File upload for equipment usage data
 uploaded_file = st.file_uploader("Upload Equipment Usage Data (CSV)", type="csv")
 
+mode = st.radio("Mode", ["Single Run", "Scenario Sweep"], horizontal=True)
+
 if uploaded_file:
     # Load the data
     data = pd.read_csv(uploaded_file)
@@ -26,53 +45,83 @@ if uploaded_file:
     st.markdown("### Uploaded Data")
     st.write(data)
 
-    # Extract unique program types and equipment names
-    program_types = data['Program_type'].unique().tolist()
-    equipment_names = data['Equipment_Name'].unique().tolist()
-
-    # Create a dictionary of usage counts
-    usage_counts = {}
-    for _, row in data.iterrows():
-        if row['Program_type'] not in usage_counts:
-            usage_counts[row['Program_type']] = {}
-        usage_counts[row['Program_type']][row['Equipment_Name']] = row['Usage_Count']
-
-    # Optimization Model
-    model = gp.Model("Equipment Allocation")
-    x = model.addVars(program_types, equipment_names, vtype=GRB.BINARY, name="x")
-
-    # Objective: Maximize total usage count
-    model.setObjective(
-        gp.quicksum(x[i, j] * usage_counts.get(i, {}).get(j, 0) for i in program_types for j in equipment_names),
-        GRB.MAXIMIZE
-    )
-
-    # Constraints
-    # Equipment availability
-    for j in equipment_names:
-        model.addConstr(
-            gp.quicksum(x[i, j] for i in program_types) <= 1,
-            name=f"Equipment_Availability_{j}"
-        )
-
-    # Optimize the model
-    model.optimize()
-
-    # Display results
-    if model.status == GRB.OPTIMAL:
-        st.markdown("### Optimal Equipment Allocation")
-        results = []
-        for i in program_types:
-            for j in equipment_names:
-                if x[i, j].x > 0.5:
-                    results.append({"Program Type": i, "Equipment": j, "Usage Count": usage_counts[i][j]})
-
-        results_df = pd.DataFrame(results)
-        st.table(results_df)
-
-        # Visualize the results
-        st.markdown("### Allocation Summary")
-        allocation_summary = results_df.groupby("Program Type").sum(numeric_only=True)
-        st.bar_chart(allocation_summary)
+    # Extract program types, equipment names and usage counts
+    program_types, equipment_names, usage_counts = build_usage_counts(data)
+
+    if mode == "Single Run":
+        # Optimize the model
+        result = solve_allocation(program_types, equipment_names, usage_counts)
+
+        # Display results
+        if result["optimal"]:
+            st.markdown("### Optimal Equipment Allocation")
+            results = [
+                {"Program Type": i, "Equipment": j, "Usage Count": usage_counts[i][j]}
+                for i in program_types
+                for j in equipment_names
+                if result["allocation"].get(j) == i
+            ]
+
+            results_df = pd.DataFrame(results)
+            st.table(results_df)
+
+            # Visualize the results
+            st.markdown("### Allocation Summary")
+            allocation_summary = results_df.groupby("Program Type").sum(numeric_only=True)
+            st.bar_chart(allocation_summary)
+        else:
+            st.error("No optimal solution found.")
     else:
-        st.error("No optimal solution found.")
\ No newline at end of file
+        st.markdown("### Scenario Grid")
+
+        # Usage counts for the full dataset and each month, shared by every scenario
+        prepared = preprocess_usage(data)
+
+        # Months
+        months = [None]
+        if MONTH_COLUMN in data.columns:
+            selected_months = st.multiselect("Months to solve separately", prepared_months(prepared))
+            include_all_months = st.checkbox("Include the full dataset", value=True)
+            months = ([None] if include_all_months or not selected_months else []) + selected_months
+        else:
+            st.info(f"Add a `{MONTH_COLUMN}` column to the data to sweep over months.")
+
+        # Equipment removal
+        selected_removals = st.multiselect("Equipment to remove (one scenario each)", equipment_names)
+        removed_equipment = [()] + [(j,) for j in selected_removals]
+
+        # Usage multipliers
+        selected_programs = st.multiselect("Program types to scale", program_types)
+        factors_text = st.text_input("Usage multipliers (comma separated)", value="0.5, 1.5")
+        try:
+            factors = [float(f) for f in factors_text.split(",") if f.strip()]
+        except ValueError:
+            st.error("Usage multipliers must be numbers.")
+            st.stop()
+        multipliers = [{}] + [{i: f} for i in selected_programs for f in factors]
+
+        scenarios = build_scenario_grid(months, removed_equipment, multipliers)
+        cpus = available_cpus()
+        if cpus > 1:
+            max_workers = st.slider("Worker processes", min_value=1, max_value=cpus, value=cpus)
+        else:
+            max_workers = 1
+        st.write(f"**{len(scenarios)}** scenarios will be solved.")
+
+        if st.button("Run Sweep"):
+            with st.spinner("Solving scenarios..."):
+                start = time.perf_counter()
+                comparison_df, baselines = run_scenario_sweep(prepared, scenarios, max_workers=max_workers)
+                elapsed = time.perf_counter() - start
+
+            st.markdown("### Scenario Comparison")
+            st.write(f"Solved {len(scenarios)} scenarios in {elapsed:.2f}s. "
+                     "Each scenario is compared with the unperturbed solve for the same month.")
+            for month, baseline in baselines.items():
+                label = "Full dataset" if month is None else f"{MONTH_COLUMN} {month}"
+                if not baseline["optimal"]:
+                    st.error(f"No optimal solution found for the {label} baseline.")
+            st.dataframe(comparison_df)
+
+            st.markdown("### Objective Change vs. Baseline")
+            st.bar_chart(comparison_df.set_index("Scenario")["Objective Change"])
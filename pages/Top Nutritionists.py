@@ -1,20 +1,43 @@
 import streamlit as st
 import pandas as pd
-from sqlalchemy import create_engine, text
 from datetime import datetime, timedelta
 import tempfile
 
 
 # Load environment variables from .env file (if using)
 
+st.set_page_config(page_title="Top Nutritionists", layout="wide")
+
+# Static content and the sidebar skeleton render before the database is touched
+st.title("🏆 Top Nutritionists Dashboard")
+
+st.markdown("""
+**Explanation**:
+This enhanced dashboard uses the `Nutritionist_Performance` table to focus on:
+- **Active_Client_Count**: The number of active clients a nutritionist has.
+- **Total_Client_Count**: The total number of clients a nutritionist has.
+- **Total_Health_Improvement**: The total health improvement score for the nutritionist.
+""")
+
+# Sidebar filters
+st.sidebar.header("🔍 Filters")
+
+default_start_date = datetime.today() - timedelta(days=180)
+default_end_date = datetime.today()
+start_date = st.sidebar.date_input("Start Date", value=default_start_date)
+end_date = st.sidebar.date_input("End Date", value=default_end_date)
+
+if start_date > end_date:
+    st.sidebar.error("❌ **Error:** Start date must be earlier than or equal to End date.")
+    st.stop()
+
 # ------------------------------
 # Database Connection
 # ------------------------------
 
-st.set_page_config(page_title="Top Nutritionists", layout="wide")
-
-# Create the database engine and test connection
-try:
+# Create the database engine once per server process
+@st.cache_resource(show_spinner=False)
+def get_engine():
     # Aiven server credentials
     DB_USER = st.secrets["database"]["DB_USER"]
     DB_PASS = st.secrets["database"]["DB_PASS"]
@@ -27,13 +50,23 @@ try:
     with tempfile.NamedTemporaryFile(delete=False, suffix='.pem') as temp_file:
         temp_file.write(ssl_ca.encode('utf-8'))  # Write the certificate content
         SSL_CA_PATH = temp_file.name  # Save the temporary file path
+    # SQLAlchemy and the MySQL driver are only imported once credentials are available
+    from sqlalchemy import create_engine
+
     engine = create_engine(
         f"mysql+pymysql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}?ssl_ca={SSL_CA_PATH}"
     )
+    return engine
 
-    # Test the connection
-    with engine.connect() as conn:
-        conn.execute(text("SELECT 1"))
+
+try:
+    with st.spinner("Connecting to the Aiven database..."):
+        engine = get_engine()
+        from sqlalchemy import text
+
+        # Test the connection on every run; the cached engine outlives outages
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
     st.success("Connected to the Aiven database successfully!")
 except Exception as e:
     st.error(f"Error connecting to the Aiven database: {e}")
@@ -46,6 +79,8 @@ except Exception as e:
 def get_nutritionist_performance(min_clients=0, pay_rate_min=0, pay_rate_max=200000, 
                                  selected_nutritionists=None, health_score_min=None, 
                                  health_score_max=None, start_date=None, end_date=None):
+    from sqlalchemy import text
+
     query = """
     SELECT 
         np.Nutritionist_ID,
@@ -130,6 +165,8 @@ def get_nutritionist_list():
 
 @st.cache_data
 def get_avg_bmi_trend(start_date=None, end_date=None):
+    from sqlalchemy import text
+
     query = "SELECT * FROM Avg_BMI_Trend   WHERE 1=1"
     params = {}
     if start_date:
@@ -152,28 +189,6 @@ def get_avg_bmi_trend(start_date=None, end_date=None):
         df['Avg_BMI'] = pd.to_numeric(df['Avg_BMI'], errors='coerce')
     return df
 
-st.title("🏆 Top Nutritionists Dashboard")
-
-st.markdown("""
-**Explanation**:
-This enhanced dashboard uses the `Nutritionist_Performance` table to focus on:
-- **Active_Client_Count**: The number of active clients a nutritionist has.
-- **Total_Client_Count**: The total number of clients a nutritionist has.
-- **Total_Health_Improvement**: The total health improvement score for the nutritionist.
-""")
-
-# Sidebar filters
-st.sidebar.header("🔍 Filters")
-
-default_start_date = datetime.today() - timedelta(days=180)
-default_end_date = datetime.today()
-start_date = st.sidebar.date_input("Start Date", value=default_start_date)
-end_date = st.sidebar.date_input("End Date", value=default_end_date)
-
-if start_date > end_date:
-    st.sidebar.error("❌ **Error:** Start date must be earlier than or equal to End date.")
-    st.stop()
-
 st.sidebar.subheader("💰 Nutritionist Pay Rate Range")
 nutritionist_df = get_nutritionist_list()
 
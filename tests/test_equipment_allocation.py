@@ -0,0 +1,140 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from equipment_allocation import (
+    apply_scenario,
+    build_scenario_grid,
+    build_usage_counts,
+    compare_to_baseline,
+    prepared_months,
+    preprocess_usage,
+)
+
+
+def make_data():
+    return pd.DataFrame({
+        "Month": [1, 1, 2, 2],
+        "Program_type": ["Yoga", "HIIT", "Yoga", "HIIT"],
+        "Equipment_Name": ["Mat", "Rower", "Mat", "Mat"],
+        "Usage_Count": [10, 20, 30, 40],
+    })
+
+
+def make_result(allocation, objective, optimal=True):
+    return {"optimal": optimal, "objective": objective, "allocation": allocation, "solve_time": 0.1}
+
+
+def test_build_usage_counts_later_rows_win():
+    program_types, equipment_names, usage_counts = build_usage_counts(make_data())
+
+    assert program_types == ["Yoga", "HIIT"]
+    assert equipment_names == ["Mat", "Rower"]
+    assert usage_counts == {"Yoga": {"Mat": 30}, "HIIT": {"Rower": 20, "Mat": 40}}
+
+
+def test_preprocess_usage_splits_months():
+    prepared = preprocess_usage(make_data())
+
+    assert set(prepared) == {None, 1, 2}
+    assert prepared[1][2] == {"Yoga": {"Mat": 10}, "HIIT": {"Rower": 20}}
+    assert prepared[2][1] == ["Mat"]
+
+
+def test_preprocess_usage_without_month_column():
+    prepared = preprocess_usage(make_data().drop(columns="Month"))
+
+    assert list(prepared) == [None]
+
+
+def test_preprocess_usage_skips_blank_and_mixed_months():
+    data = make_data()
+    data["Month"] = ["Jan", None, 2, 2]
+
+    prepared = preprocess_usage(data)
+
+    assert set(prepared) == {None, "Jan", 2}
+    assert prepared_months(prepared) == [2, "Jan"]
+    # The row without a month still counts towards the full dataset
+    assert prepared[None][2]["HIIT"]["Rower"] == 20
+
+
+def test_prepared_months_sorts_naturally():
+    assert prepared_months(preprocess_usage(make_data().iloc[::-1])) == [1, 2]
+
+
+def test_build_scenario_grid_names():
+    scenarios = build_scenario_grid([None, 1], [(), ("Mat",)], [{}, {"Yoga": 1.5}])
+
+    assert [s["name"] for s in scenarios] == [
+        "Baseline",
+        "Yoga x1.5",
+        "without Mat",
+        "without Mat; Yoga x1.5",
+        "Month=1",
+        "Month=1; Yoga x1.5",
+        "Month=1; without Mat",
+        "Month=1; without Mat; Yoga x1.5",
+    ]
+    assert build_scenario_grid() == [
+        {"name": "Baseline", "month": None, "removed_equipment": (), "multipliers": {}}
+    ]
+
+
+def test_apply_scenario_removes_equipment_and_scales_usage():
+    prepared = preprocess_usage(make_data())
+    scenario = build_scenario_grid([1], [("Mat",)], [{"HIIT": 2}])[0]
+
+    program_types, equipment_names, usage_counts = apply_scenario(prepared, scenario)
+
+    assert program_types == ["Yoga", "HIIT"]
+    assert equipment_names == ["Rower"]
+    assert usage_counts == {"Yoga": {}, "HIIT": {"Rower": 40}}
+    # The shared preprocessed data is left untouched
+    assert prepared[1][2] == {"Yoga": {"Mat": 10}, "HIIT": {"Rower": 20}}
+
+
+def test_compare_to_baseline_uses_same_month_baseline():
+    scenarios = build_scenario_grid([None, 1], [(), ("Mat",)])
+    results = [
+        make_result({"Mat": "HIIT", "Rower": "HIIT"}, 60),
+        make_result({"Rower": "HIIT"}, 20),
+        make_result({"Mat": "Yoga", "Rower": "HIIT"}, 30),
+        make_result({"Rower": "HIIT"}, 20),
+    ]
+    baselines = {None: results[0], 1: results[2]}
+
+    df = compare_to_baseline(scenarios, results, baselines)
+
+    assert df["Baseline"].tolist() == ["Baseline", "Baseline", "Month=1", "Month=1"]
+    assert df["Objective Change"].tolist() == [0, -40, 0, -10]
+    assert df["Allocation Changes"].tolist() == [0, 1, 0, 1]
+    assert df["Changed Equipment"].tolist() == ["", "Mat", "", "Mat"]
+
+
+def test_compare_to_baseline_non_optimal_reports_no_changes():
+    scenarios = build_scenario_grid([None], [(), ("Mat",)])
+    results = [make_result({"Mat": "HIIT"}, 40), make_result({}, None, optimal=False)]
+
+    row = compare_to_baseline(scenarios, results, {None: results[0]}).iloc[1]
+
+    assert not row["Optimal"]
+    assert pd.isna(row["Objective Change"])
+    assert pd.isna(row["Allocation Changes"])
+    assert pd.isna(row["Changed Equipment"])
+
+
+def test_run_scenario_sweep_small_grid_solves_in_process():
+    pytest.importorskip("gurobipy")
+    from equipment_allocation import run_scenario_sweep
+
+    prepared = preprocess_usage(make_data())
+    scenarios = build_scenario_grid([None, 1], [("Mat",)])
+
+    df, baselines = run_scenario_sweep(prepared, scenarios, max_workers=4)
+
+    # Unperturbed baselines are solved for each month even when the grid lacks them
+    assert set(baselines) == {None, 1}
+    assert baselines[None]["objective"] == 60
+    assert baselines[1]["objective"] == 30
+    assert df["Objective Change"].tolist() == [-40, -10]